@@ -55,8 +55,12 @@ pose.load(objects=["Character1:Hand_L", "Character1:Finger_L"])
 
 """
 import os
+import copy
 import shutil
 import logging
+import threading
+import contextlib
+import collections
 
 from studiovendor.Qt import QtWidgets
 
@@ -82,6 +86,11 @@ BLEND_SHAPE_TYPE = "blendShape"
 # A feature flag that will be removed in the future.
 FIX_SAVE_ANIM_REFERENCE_LOCKED_ERROR = True
 
+# The parsed data for the most recently read paths keyed by
+# (path, mtime, size)
+_DATA_CACHE = collections.OrderedDict()
+_DATA_CACHE_SIZE = 32
+
 class PasteOption:
 
     Insert = "insert"
@@ -100,13 +109,40 @@ class OutOfBoundsError(AnimationTransferError):
     pass
 
 
+def _isBlendshape(name):
+    """
+    Return True if the given node is a blendShape node.
+
+    :type name: str
+    :rtype: bool
+    """
+    return maya.cmds.nodeType(name) == BLEND_SHAPE_TYPE
+
+
+@contextlib.contextmanager
+def _noUndo():
+    """
+    Context manager for running commands without recording them in the
+    undo queue.
+
+    The existing undo queue is kept, so an open undo chunk can still be
+    undone afterwards.
+    """
+    initialUndoState = maya.cmds.undoInfo(query=True, state=True)
+    maya.cmds.undoInfo(stateWithoutFlush=False)
+    try:
+        yield
+    finally:
+        maya.cmds.undoInfo(stateWithoutFlush=initialUndoState)
+
+
 def validateAnimLayers():
     """
     Check if the selected animation layer can be exported.
     
     :raise: AnimationTransferError
     """
-    animLayers = maya.mel.eval('$gSelectedAnimLayers=$gSelectedAnimLayers')
+    animLayers = maya.mel.eval('$gSelectedAnimLayers=$gSelectedAnimLayers') or []
 
     # Check if more than one animation layer has been selected.
     if len(animLayers) > 1:
@@ -123,6 +159,31 @@ def validateAnimLayers():
 
             raise AnimationTransferError(msg)
 
+def _copyPreviewFiles(path, iconPath, sequencePath, errors):
+    """
+    Copy the icon and move the sequence to the given path.
+
+    Any exception is appended to the given errors list, so that it can
+    be raised by the caller when running in a thread.
+
+    :type path: str
+    :type iconPath: str
+    :type sequencePath: str
+    :type errors: list[Exception]
+    """
+    try:
+        if iconPath:
+            shutil.copyfile(iconPath, path + "/thumbnail.jpg")
+
+        # shutil.move renames the sequence when it is on the same
+        # file system and only copies it when it is not.
+        if sequencePath:
+            shutil.move(sequencePath, path + "/sequence")
+
+    except Exception as error:
+        errors.append(error)
+
+
 def saveBlendshape(
         objects,
         path,
@@ -152,26 +213,33 @@ def saveBlendshape(
     :type metadata: dict or None
     :rtype: Blendshape
     """
-    # Copy the icon path to the temp location
-    if iconPath:
-        shutil.copyfile(iconPath, path + "/thumbnail.jpg")
+    # Copy the icon and sequence to the temp location in a thread,
+    # so that it doesn't block the Maya work below.
+    errors = []
+    thread = threading.Thread(
+        target=_copyPreviewFiles,
+        args=(path, iconPath, sequencePath, errors)
+    )
+    thread.start()
 
-    # Copy the sequence path to the temp location
-    if sequencePath:
-        shutil.move(sequencePath, path + "/sequence")
+    try:
+        blendshape = mutils.Blendshape.fromObjects(objects)
 
-    blendshape = mutils.Blendshape.fromObjects(objects)
+        if metadata:
+            blendshape.updateMetadata(metadata)
 
-    if metadata:
-        blendshape.updateMetadata(metadata)
+        blendshape.save(
+            path,
+            time=time,
+            sampleBy=sampleBy,
+            fileType=fileType,
+            bakeConnected=bakeConnected
+        )
+    finally:
+        thread.join()
 
-    blendshape.save(
-        path,
-        time=time,
-        sampleBy=sampleBy,
-        fileType=fileType,
-        bakeConnected=bakeConnected
-    )
+    if errors:
+        raise errors[0]
 
     return blendshape
 
@@ -191,7 +259,7 @@ def loadBlendshape(
     """
     Load the animations in the given order of paths with the spacing specified.
 
-    :type paths: list[str]
+    :type path: str or list[str]
     :type spacing: int
     :type connect: bool
     :type objects: list[str]
@@ -204,6 +272,11 @@ def loadBlendshape(
     """
     isFirstAnim = True
 
+    if isinstance(path, basestring):
+        paths = [path]
+    else:
+        paths = path
+
     if spacing < 1:
         spacing = 1
 
@@ -217,8 +290,8 @@ def loadBlendshape(
 
         msg = "Load the following animation in sequence;\n"
 
-        for i, path in enumerate(paths):
-            msg += "\n {0}. {1}".format(i, os.path.basename(path))
+        for i, animPath in enumerate(paths):
+            msg += "\n {0}. {1}".format(i, os.path.basename(animPath))
 
         msg += "\n\nPlease choose the spacing between each animation."
 
@@ -233,9 +306,10 @@ def loadBlendshape(
         if not accepted:
             raise Exception("Dialog canceled!")
 
-    for path in paths:
+    # Read all the files before loading any of them
+    anims = [mutils.Blendshape.fromPath(animPath) for animPath in paths]
 
-        anim = mutils.Blendshape.fromPath(path)
+    for anim in anims:
 
         if startFrame is None and isFirstAnim:
             startFrame = anim.startFrame()
@@ -260,6 +334,48 @@ def loadBlendshape(
 
 class Blendshape(mutils.Animation):
 
+    @classmethod
+    def fromPath(cls, path):
+        """
+        Create and return a Blendshape object from the given path.
+
+        The parsed data is cached by path, modification time and size,
+        so reading an unchanged file again does not parse it again.
+        Each object gets its own copy of the cached data.
+
+        :type path: str
+        :rtype: Blendshape
+        """
+        blendshape = cls()
+        blendshape.setPath(path)
+
+        stat = os.stat(blendshape.poseJsonPath())
+        key = (blendshape.path(), stat.st_mtime, stat.st_size)
+        data = _DATA_CACHE.pop(key, None)
+
+        if data is None:
+            blendshape.read()
+            data = copy.deepcopy(blendshape.data())
+        else:
+            blendshape.setData(copy.deepcopy(data))
+
+        _DATA_CACHE[key] = data
+        while len(_DATA_CACHE) > _DATA_CACHE_SIZE:
+            _DATA_CACHE.popitem(last=False)
+
+        return blendshape
+
+    @staticmethod
+    def clearDataCache(path=None):
+        """
+        Clear the cached data for the given path or for all paths.
+
+        :type path: str or None
+        """
+        for key in list(_DATA_CACHE.keys()):
+            if path is None or key[0] == path:
+                del _DATA_CACHE[key]
+
     def __init__(self):
         mutils.TransferObject.__init__(self)
 
@@ -270,6 +386,7 @@ class Blendshape(mutils.Animation):
         self._selection = None
         self._mirrorTable = None
         self._autoKeyFrame = None
+        self._blendshapeCache = {}
 
     # def getBlendshapeParamList(self, name):
     #     attrs = []
@@ -281,6 +398,28 @@ class Blendshape(mutils.Animation):
     #         attrs.append(alias_attr_name)
     #     return attrs
 
+    def _describe(self, name):
+        """
+        Return if the given node is a blendShape and its weight aliases.
+
+        The result is cached by node name so that saving does not query
+        the aliases that were already queried when the object was added.
+
+        :type name: str
+        :rtype: (bool, list[str] or None)
+        """
+        result = self._blendshapeCache.get(name)
+
+        if result is None:
+            if _isBlendshape(name):
+                result = (True, self.getBlendshapeParamList(name))
+            else:
+                result = (False, None)
+
+            self._blendshapeCache[name] = result
+
+        return result
+
     def createObjectData(self, name):
         """
         Create the object data for the given object name.
@@ -289,30 +428,34 @@ class Blendshape(mutils.Animation):
         :rtype: dict
         """
         attrs = []
-        # logger.debug(("maya.cmds.ls(name, showType = True) = {0}").format(maya.cmds.ls(name, showType = True)))
-        # [u'Face', u'blendShape']
-        name_type_list = maya.cmds.ls(name, showType = True)
-        if name_type_list[1] == BLEND_SHAPE_TYPE:
-            attrs = self.getBlendshapeParamList(name)
+        isBlendshape, blendshapeAttrs = self._describe(name)
+        if isBlendshape:
+            attrs = blendshapeAttrs
         else:
             attrs = maya.cmds.listAttr(name, keyable = True) or []        
-            attrs = list(set(attrs))
-        attrs = [mutils.Attribute(name, attr) for attr in attrs]
+            attrs = list(collections.OrderedDict.fromkeys(attrs))
+
+        # Weights without an alias are returned as None and
+        # cannot be used to create an attribute.
+        attrs = [mutils.Attribute(name, attr) for attr in attrs if attr]
 
-        data = {"attrs": self.attrs(name)}
+        attrsData = self.attrs(name)
 
         for attr in attrs:
-            if attr.isValid():
-                if attr.value() is None:
-                    msg = "Cannot save the attribute %s with value None."
-                    logger.warning(msg, attr.fullname())
-                else:
-                    data["attrs"][attr.attr()] = {
-                        "type": attr.type(),
-                        "value": attr.value()
-                    }
-
-        return data
+            if not attr.isValid():
+                continue
+
+            value = attr.value()
+            if value is None:
+                msg = "Cannot save the attribute %s with value None."
+                logger.warning(msg, attr.fullname())
+            else:
+                attrsData[attr.attr()] = {
+                    "type": attr.type(),
+                    "value": value
+                }
+
+        return {"attrs": attrsData}
 
     @mutils.timing
     @mutils.unifyUndo
@@ -368,6 +511,7 @@ class Blendshape(mutils.Animation):
         self.setMetadata("startFrame", start)
 
         end += 1
+        curves = []
         validCurves = []
         deleteObjects = []
 
@@ -380,73 +524,97 @@ class Blendshape(mutils.Animation):
                 maya.cmds.undoInfo(openChunk=True)
                 mutils.bakeConnected(objects, time=(start, end), sampleBy=sampleBy)
 
-            for name in objects:
-                if maya.cmds.copyKey(name, time=(start, end), includeUpperBound=False, option="keys"):
+            # The scratch work below is thrown away after saving, so there
+            # is no need to record it in the undo queue.
+            with _noUndo():
+                for name in objects:
+                    if maya.cmds.copyKey(name, time=(start, end), includeUpperBound=False, option="keys"):
+
+                        logger.debug(name)
+                        # Might return more than one object when duplicating shapes or blendshapes
+                        # transform = maya.cmds.duplicate(name, name="CURVE", parentOnly=True)
+
+                        # if not FIX_SAVE_ANIM_REFERENCE_LOCKED_ERROR:
+                        #     mutils.disconnectAll(transform[0])
+
+                        # deleteObjects.append(transform[0])
+                        # maya.cmds.pasteKey(transform[0])
+
+                        attrs = []
+                        isBlendshape, blendshapeAttrs = self._describe(name)
+                        if isBlendshape:
+                            attrs = blendshapeAttrs
+                        else:
+                            attrs = maya.cmds.listAttr(name, unlocked=True, keyable=True) or []
+                        attrs = list(collections.OrderedDict.fromkeys(attrs))
+                        attrs = [attr for attr in attrs if attr and attr not in ('translate', 'rotate', 'scale')]
+
+                        logger.debug(("attrs = {0}").format(attrs))
+                        for attr in attrs:
+                            logger.debug(("transform name = {0}, attr name = {1}").format(name, attr))
+                            dstAttr = mutils.Attribute(name, attr)
+                            dstCurve = dstAttr.animCurve()
+
+                            if dstCurve:
+
+                                # dstCurve = maya.cmds.rename(dstCurve, "CURVE")
+                                # deleteObjects.append(dstCurve)
+
+                                # srcAttr = mutils.Attribute(name, attr)
+                                # srcCurve = srcAttr.animCurve()
+
+                                # if srcCurve:
+                                #     preInfinity = maya.cmds.getAttr(srcCurve + ".preInfinity")
+                                #     postInfinity = maya.cmds.getAttr(srcCurve + ".postInfinity")
+                                #     curveColor = maya.cmds.getAttr(srcCurve + ".curveColor")
+                                #     useCurveColor = maya.cmds.getAttr(srcCurve + ".useCurveColor")
+
+                                #     maya.cmds.setAttr(dstCurve + ".preInfinity", preInfinity)
+                                #     maya.cmds.setAttr(dstCurve + ".postInfinity", postInfinity)
+                                #     maya.cmds.setAttr(dstCurve + ".curveColor", *curveColor[0])
+                                #     maya.cmds.setAttr(dstCurve + ".useCurveColor", useCurveColor)
+
+                                curves.append((name, attr, dstCurve))
+
+                # Query all the curves with keys in the frame range at once
+                # instead of querying the key count for each curve.
+                if curves:
+                    keyedCurves = maya.cmds.keyframe(
+                        [curve for _, _, curve in curves],
+                        query=True,
+                        name=True,
+                        time=(start, end),
+                    ) or []
+                    keyedCurves = set(keyedCurves)
+
+                    for name, attr, dstCurve in curves:
+                        if dstCurve in keyedCurves:
+                            self.setAnimCurve(name, attr, dstCurve)
+                            # maya.cmds.cutKey(dstCurve, time=(MIN_TIME_LIMIT, start - 1))
+                            # maya.cmds.cutKey(dstCurve, time=(end + 1, MAX_TIME_LIMIT))
+                            validCurves.append(dstCurve)
+
+                fileName = "animation.ma"
+                if fileType == "mayaBinary":
+                    fileName = "animation.mb"
+
+                mayaPath = os.path.join(path, fileName)
+                posePath = os.path.join(path, "pose.json")
+                mutils.Pose.save(self, posePath)
+
+                if validCurves:
+                    maya.cmds.select(validCurves)
+                    logger.info("Saving animation: %s" % mayaPath)
+                    maya.cmds.file(mayaPath, force=True, options='v=0', type=fileType, uiConfiguration=False, exportSelected=True)
+                    self.cleanMayaFile(mayaPath)
 
-                    logger.debug(name)
-                    # Might return more than one object when duplicating shapes or blendshapes
-                    # transform = maya.cmds.duplicate(name, name="CURVE", parentOnly=True)
-
-                    # if not FIX_SAVE_ANIM_REFERENCE_LOCKED_ERROR:
-                    #     mutils.disconnectAll(transform[0])
-
-                    # deleteObjects.append(transform[0])
-                    # maya.cmds.pasteKey(transform[0])
-
-                    attrs = []
-                    name_type_list = maya.cmds.ls(name, showType = True)
-                    if name_type_list[1] == BLEND_SHAPE_TYPE:
-                        attrs = self.getBlendshapeParamList(name)
-                    else:
-                        attrs = maya.cmds.listAttr(name, unlocked=True, keyable=True) or []
-                    attrs = list(set(attrs) - set(['translate', 'rotate', 'scale']))
-
-                    logger.debug(("attrs = {0}").format(attrs))
-                    for attr in attrs:
-                        logger.debug(("transform name = {0}, attr name = {1}").format(name, attr))
-                        dstAttr = mutils.Attribute(name, attr)
-                        dstCurve = dstAttr.animCurve()
-
-                        if dstCurve:
-
-                            # dstCurve = maya.cmds.rename(dstCurve, "CURVE")
-                            # deleteObjects.append(dstCurve)
-
-                            # srcAttr = mutils.Attribute(name, attr)
-                            # srcCurve = srcAttr.animCurve()
-
-                            # if srcCurve:
-                            #     preInfinity = maya.cmds.getAttr(srcCurve + ".preInfinity")
-                            #     postInfinity = maya.cmds.getAttr(srcCurve + ".postInfinity")
-                            #     curveColor = maya.cmds.getAttr(srcCurve + ".curveColor")
-                            #     useCurveColor = maya.cmds.getAttr(srcCurve + ".useCurveColor")
-
-                            #     maya.cmds.setAttr(dstCurve + ".preInfinity", preInfinity)
-                            #     maya.cmds.setAttr(dstCurve + ".postInfinity", postInfinity)
-                            #     maya.cmds.setAttr(dstCurve + ".curveColor", *curveColor[0])
-                            #     maya.cmds.setAttr(dstCurve + ".useCurveColor", useCurveColor)
-
-                            if maya.cmds.keyframe(dstCurve, query=True, time=(start, end), keyframeCount=True):
-                                self.setAnimCurve(name, attr, dstCurve)
-                                # maya.cmds.cutKey(dstCurve, time=(MIN_TIME_LIMIT, start - 1))
-                                # maya.cmds.cutKey(dstCurve, time=(end + 1, MAX_TIME_LIMIT))
-                                validCurves.append(dstCurve)
-
-            fileName = "animation.ma"
-            if fileType == "mayaBinary":
-                fileName = "animation.mb"
-
-            mayaPath = os.path.join(path, fileName)
-            posePath = os.path.join(path, "pose.json")
-            mutils.Pose.save(self, posePath)
+        finally:
+            self._blendshapeCache = {}
+            self.clearDataCache(path)
 
-            if validCurves:
-                maya.cmds.select(validCurves)
-                logger.info("Saving animation: %s" % mayaPath)
-                maya.cmds.file(mayaPath, force=True, options='v=0', type=fileType, uiConfiguration=False, exportSelected=True)
-                self.cleanMayaFile(mayaPath)
+            if self.path():
+                self.clearDataCache(self.path())
 
-        finally:
             if bakeConnected:
                 # HACK! Undo all baked connections. :)
                 maya.cmds.undoInfo(closeChunk=True)
@@ -455,27 +623,3 @@ class Blendshape(mutils.Animation):
                 maya.cmds.delete(deleteObjects)
 
         self.setPath(path)
-
-    def TestBlendshape(self):
-        selections = maya.cmds.ls(selection=True) or []
-        
-        for obj in selections:
-            # print maya.cmds.listHistory(obj)
-            # print maya.cmds.findKeyframe(obj)
-            print maya.cmds.keyframe(obj, query = True, keyframeCount = True)
-
-            # attrs = maya.cmds.listAttr(obj, keyable = True) or []        
-            # attrs = list(set(attrs))
-            # print attrs
-            # attrs = [mutils.Attribute(obj, attr) for attr in attrs]
-            # for attr in attrs:
-            #     print attr.name()
-
-            if obj == "Face":
-                blend_shape_param_size = maya.cmds.getAttr(obj + ".weight", size = True)                
-                for i in range(0, blend_shape_param_size):
-                    # $attr_name = ($blend_shape + ".weight[" + $i + "]");
-                    attr_w_name = (obj + ".weight[{0}]").format(i)
-                    alias_attr_name = maya.cmds.aliasAttr(attr_w_name, query = True);
-                    print alias_attr_name
-
@@ -60,6 +60,7 @@ import mutils
 
 try:
     import maya.cmds
+    import maya.api.OpenMaya
 except ImportError:
     import traceback
     traceback.print_exc()
@@ -136,12 +137,41 @@ class Pose(mutils.TransferObject):
         self._autoKeyFrame = None
 
     def getBlendshapeParamList(self, name):
+        """
+        Return the weight alias names for the given blendShape node.
+
+        The aliases are read from the node with the API and matched to
+        the weight index, falling back to a query per weight index when
+        the node has no aliases.
+
+        :type name: str
+        :rtype: list[str]
+        """
+        blend_shape_param_size = maya.cmds.getAttr(name + ".weight", size=True)
+
+        try:
+            selectionList = maya.api.OpenMaya.MSelectionList()
+            selectionList.add(name)
+            node = maya.api.OpenMaya.MFnDependencyNode(selectionList.getDependNode(0))
+
+            # Returns a list of alias and plug name pairs.
+            # [(u'smile', u'weight[0]'), (u'blink', u'weight[1]')]
+            aliasByPlug = dict((plug, alias) for alias, plug in node.getAliasList())
+
+        except (NameError, AttributeError, RuntimeError):
+            # Older versions of Maya do not support getAliasList.
+            # Returns a flat list of alias and plug name pairs.
+            # [u'smile', u'weight[0]', u'blink', u'weight[1]']
+            pairs = maya.cmds.aliasAttr(name, query=True) or []
+            aliasByPlug = dict(zip(pairs[1::2], pairs[0::2]))
+
+        if aliasByPlug:
+            return [aliasByPlug.get("weight[{0}]".format(i)) for i in range(blend_shape_param_size)]
+
         attrs = []
-        blend_shape_param_size = maya.cmds.getAttr(name + ".weight", size = True)                
         for i in range(0, blend_shape_param_size):
-            # $attr_name = ($blend_shape + ".weight[" + $i + "]");
-            attr_w_name = (name + ".weight[{0}]").format(i)
-            alias_attr_name = maya.cmds.aliasAttr(attr_w_name, query = True);
+            attr_w_name = name + ".weight[{0}]".format(i)
+            alias_attr_name = maya.cmds.aliasAttr(attr_w_name, query=True)
             attrs.append(alias_attr_name)
         return attrs
 
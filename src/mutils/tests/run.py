@@ -37,6 +37,7 @@ def testSuite():
     import test_pose
     import test_anim
     import test_match
+    import test_blendshape
     import test_utils
     import test_attribute
     import test_mirrortable
@@ -61,6 +62,9 @@ def testSuite():
     s = unittest.makeSuite(test_mirrortable.TestMirrorTable, 'test')
     suite.addTest(s)
 
+    s = unittest.makeSuite(test_blendshape.TestBlendshape, 'test')
+    suite.addTest(s)
+
     return suite
 
 
@@ -0,0 +1,116 @@
+# Copyright 2019 by Kurt Rathjen. All Rights Reserved.
+#
+# This library is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version. This library is distributed in the
+# hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library. If not, see <http://www.gnu.org/licenses/>.
+"""
+# Example:
+import mutils.tests.test_blendshape
+reload(mutils.tests.test_blendshape)
+mutils.tests.test_blendshape.run()
+"""
+import unittest
+
+import maya.cmds
+
+import mutils
+
+import test_base
+
+
+class TestBlendshape(test_base.TestBase):
+
+    def setUp(self):
+        """
+        Create a new scene with keys inside and outside the save range.
+        """
+        maya.cmds.file(new=True, force=True)
+
+        self.node = maya.cmds.createNode("transform", name="keyedNode")
+
+        # Keys inside the save range
+        maya.cmds.setKeyframe(self.node, attribute="translateX", time=1, value=0)
+        maya.cmds.setKeyframe(self.node, attribute="translateX", time=5, value=10)
+
+        # Keys after the save range
+        maya.cmds.setKeyframe(self.node, attribute="translateY", time=20, value=0)
+        maya.cmds.setKeyframe(self.node, attribute="translateY", time=30, value=10)
+
+        # Keys on both sides of the save range, but none inside it
+        maya.cmds.setKeyframe(self.node, attribute="translateZ", time=-10, value=0)
+        maya.cmds.setKeyframe(self.node, attribute="translateZ", time=20, value=10)
+
+        self.start = 1
+        self.end = 10
+
+    def animCurve(self, attr):
+        """
+        Return the anim curve connected to the given attribute.
+
+        :type attr: str
+        :rtype: str
+        """
+        return mutils.Attribute(self.node, attr).animCurve()
+
+    def test_keyframe_name_query(self):
+        """
+        Test the batched name query returns the same curves as
+        querying the key count for each curve.
+        """
+        curves = [
+            self.animCurve("translateX"),
+            self.animCurve("translateY"),
+            self.animCurve("translateZ"),
+        ]
+
+        time = (self.start, self.end + 1)
+
+        expected = set()
+        for curve in curves:
+            if maya.cmds.keyframe(curve, query=True, time=time, keyframeCount=True):
+                expected.add(curve)
+
+        result = maya.cmds.keyframe(curves, query=True, name=True, time=time) or []
+
+        self.assertEqual(expected, set(result))
+        self.assertEqual(set([self.animCurve("translateX")]), set(result))
+
+    def test_save_keyed_curves(self):
+        """
+        Test saving only exports the curves with keys in the frame range.
+        """
+        dstPath = self.dataPath("test_save_keyed_curves.blendshape")
+
+        blendshape = mutils.Blendshape.fromObjects([self.node])
+        blendshape.save(dstPath, time=(self.start, self.end), bakeConnected=False)
+
+        attrs = blendshape.objects()[self.node].get("attrs", {})
+        curves = [attr for attr in attrs if "curve" in attrs[attr]]
+
+        self.assertEqual(["translateX"], curves)
+
+
+def testSuite():
+    """
+    Return the test suite for the test case.
+
+    :rtype: unittest.TestSuite
+    """
+    suite = unittest.TestSuite()
+    s = unittest.makeSuite(TestBlendshape, 'test')
+    suite.addTest(s)
+    return suite
+
+
+def run():
+    """
+    Call from within Maya to run all valid tests.
+    """
+    tests = unittest.TextTestRunner()
+    tests.run(testSuite())
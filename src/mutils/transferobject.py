@@ -41,6 +41,12 @@ except Exception:
     import traceback
     traceback.print_exc()
 
+# orjson is optional and much faster than json when reading large pose files.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +87,18 @@ class TransferObject(object):
         :type path: str
         :rtype: dict
         """
+        if orjson:
+            # Parse the bytes directly to avoid decoding them first
+            with open(path, "rb") as f:
+                data = f.read() or b"{}"
+
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # orjson rejects the NaN and Infinity values that
+                # json.dumps writes by default, so use json for those.
+                return json.loads(data.decode("utf-8"))
+
         with open(path, "r") as f:
             data = f.read() or "{}"
 
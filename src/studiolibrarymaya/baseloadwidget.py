@@ -35,6 +35,26 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
+# Decoded type icons shared by all load widgets, keyed by path.
+_PIXMAP_CACHE = {}
+
+
+def _pixmap(path):
+    """
+    Return the pixmap for the given path, decoding it only once.
+
+    :type path: str
+    :rtype: QtGui.QPixmap
+    """
+    pixmap = _PIXMAP_CACHE.get(path)
+
+    if pixmap is None:
+        pixmap = QtGui.QPixmap(path)
+        _PIXMAP_CACHE[path] = pixmap
+
+    return pixmap
+
+
 class BaseLoadWidget(QtWidgets.QWidget):
 
     """Base widget for loading items."""
@@ -55,9 +75,25 @@ class BaseLoadWidget(QtWidgets.QWidget):
         self._scriptJob = None
         self._formWidget = None
         self._infoFormWidget = None
+        self._infoBuilt = False
+        self._selectionHash = None
+
+        # Coalesce the selection changes triggered by the script job,
+        # so that many changes in a row only validate the form once.
+        self._selectionChangedTimer = QtCore.QTimer(self)
+        self._selectionChangedTimer.setSingleShot(True)
+        self._selectionChangedTimer.setInterval(0)
+        self._selectionChangedTimer.timeout.connect(self.selectionChanged)
+
+        # Only update the thumbnail size once the user stops resizing.
+        self._thumbnailSize = None
+        self._resizeTimer = QtCore.QTimer(self)
+        self._resizeTimer.setSingleShot(True)
+        self._resizeTimer.setInterval(16)
+        self._resizeTimer.timeout.connect(self.updateThumbnailSize)
 
         self.ui.titleLabel.setText(item.MenuName)
-        self.ui.titleIcon.setPixmap(QtGui.QPixmap(item.TypeIconPath))
+        self.ui.titleIcon.setPixmap(_pixmap(item.TypeIconPath))
 
         # Create the icon group box
         groupBox = studiolibrary.widgets.GroupBoxWidget("Icon", self.ui.iconFrame)
@@ -70,23 +106,22 @@ class BaseLoadWidget(QtWidgets.QWidget):
         self.ui.thumbnailButton.setObjectName("thumbnailButton")
         self.ui.thumbnailFrame.layout().insertWidget(0, self.ui.thumbnailButton)
 
-        if os.path.exists(item.imageSequencePath()):
-            self.ui.thumbnailButton.setPath(item.imageSequencePath())
+        imageSequencePath = item.imageSequencePath()
 
-        elif os.path.exists(item.thumbnailPath()):
-            self.ui.thumbnailButton.setPath(item.thumbnailPath())
+        if imageSequencePath and os.path.exists(imageSequencePath):
+            self.ui.thumbnailButton.setPath(imageSequencePath)
 
-        # Create the info widget and set the info schema
-        self._infoFormWidget = studiolibrary.widgets.FormWidget(self)
-        self._infoFormWidget.setSchema(item.info())
-        self.ui.infoFrame.layout().addWidget(self._infoFormWidget)
+        else:
+            # Only resolve the thumbnail path when there is no sequence.
+            thumbnailPath = item.thumbnailPath()
+            if os.path.exists(thumbnailPath):
+                self.ui.thumbnailButton.setPath(thumbnailPath)
 
         # Create the load widget and set the load schema
         self._formWidget = studiolibrary.widgets.FormWidget(self)
         self._formWidget.setObjectName(item.__class__.__name__ + "Form")
         self._formWidget.setSchema(item.loadSchema())
         self._formWidget.setValidator(item.loadValidator)
-        self._formWidget.validate()
         self.ui.formFrame.layout().addWidget(self._formWidget)
 
         try:
@@ -110,6 +145,24 @@ class BaseLoadWidget(QtWidgets.QWidget):
         """
         self._formWidget.setValue(field, value)
 
+    def showEvent(self, event):
+        """
+        Overriding to create the info widget when first shown.
+
+        :type event: QtGui.QShowEvent
+        """
+        QtWidgets.QWidget.showEvent(self, event)
+
+        if not self._infoBuilt:
+            self._infoBuilt = True
+            self.createInfoWidget()
+
+    def createInfoWidget(self):
+        """Create the info widget and set the info schema."""
+        self._infoFormWidget = studiolibrary.widgets.FormWidget(self)
+        self._infoFormWidget.setSchema(self.item().info())
+        self.ui.infoFrame.layout().addWidget(self._infoFormWidget)
+
     def loadUi(self):
         """Convenience method for loading the .ui file."""
         studioqt.loadUi(self, cls=BaseLoadWidget)
@@ -137,7 +190,7 @@ class BaseLoadWidget(QtWidgets.QWidget):
 
         :type event: QtCore.QSizeEvent
         """
-        self.updateThumbnailSize()
+        self._resizeTimer.start()
 
     def updateThumbnailSize(self):
         """Update the thumbnail button to the size of the widget."""
@@ -146,6 +199,10 @@ class BaseLoadWidget(QtWidgets.QWidget):
             width = 250
 
         size = QtCore.QSize(width, width)
+        if size == self._thumbnailSize:
+            return
+
+        self._thumbnailSize = size
         self.ui.thumbnailButton.setIconSize(size)
         self.ui.thumbnailButton.setMaximumSize(size)
         self.ui.thumbnailFrame.setMaximumSize(size)
@@ -178,7 +235,7 @@ class BaseLoadWidget(QtWidgets.QWidget):
         """
         if enabled:
             if not self._scriptJob:
-                event = ['SelectionChanged', self.selectionChanged]
+                event = ['SelectionChanged', self._selectionChangedTimer.start]
                 self._scriptJob = mutils.ScriptJob(event=event)
         else:
             sj = self.scriptJob()
@@ -188,6 +245,12 @@ class BaseLoadWidget(QtWidgets.QWidget):
 
     def selectionChanged(self):
         """Triggered when the users Maya selection has changed."""
+        # Only validate when the selected objects have actually changed
+        selectionHash = hash(tuple(maya.cmds.ls(selection=True, long=True) or []))
+        if selectionHash == self._selectionHash:
+            return
+
+        self._selectionHash = selectionHash
         self._formWidget.validate()
 
     def accept(self):
@@ -12,10 +12,7 @@
 import os
 import logging
 
-from studiovendor.Qt import QtCore
-
 from studiolibrarymaya import baseitem
-from studiolibrarymaya import baseloadwidget
 
 try:
     import mutils
@@ -33,53 +30,23 @@ logger = logging.getLogger(__name__)
 
 
 DIRNAME = os.path.dirname(__file__)
-ICON_PATH = os.path.join(DIRNAME, "resource", "icons", "pose.png")
-
-
-# class PoseLoadWidget(baseloadwidget.BaseLoadWidget):
-
-#     def __init__(self, *args, **kwargs):
-#         """
-#         Using a custom load widget to support nicer blending.
-#         """
-#         super(PoseLoadWidget, self).__init__(*args, **kwargs)
-
-#         self.ui.blendSlider.sliderMoved.connect(self.sliderMoved)
-#         self.ui.blendSlider.sliderReleased.connect(self.sliderReleased)
-
-#         self.item().blendChanged.connect(self.setSliderValue)
-
-#     def setSliderValue(self, value):
-#         """
-#         Trigger when the item changes blend value.
+ICON_PATH = os.path.join(DIRNAME, "icons", "pose.png")
 
-#         :type value: int
-#         """
-#         self.ui.blendSlider.setValue(value)
 
-#     def sliderReleased(self):
-#         """Triggered when the user releases the slider handle."""
-#         self.item().loadFromCurrentOptions(
-#             blend=self.ui.blendSlider.value(),
-#             refresh=False,
-#             showBlendMessage=True
-#         )
+# Maps the load option labels to the names used by the transfer object
+_OPTION_MAP = {
+    "replace all": "replaceCompletely",
+    "replace": "replace",
+    "insert": "insert",
+    "merge": "merge",
+}
 
-#     def sliderMoved(self, value):
-#         """
-#         Triggered when the user moves the slider handle.
+_CONNECT_SUFFIX = dict(
+    (name, name if name == "replaceCompletely" else name + "Connect")
+    for name in _OPTION_MAP.values()
+)
 
-#         :type value: float
-#         """
-#         self.item().loadFromCurrentOptions(
-#             blend=value,
-#             batchMode=True,
-#             showBlendMessage=True
-#         )
-
-#     def accept(self):
-#         """Triggered when the user clicks the apply button."""
-#         self.item().loadFromCurrentOptions(clearSelection=False)
+_DEFAULT_FRAME_RANGE = (0, 1)
 
 
 class BlendshapeItem(baseitem.BaseItem):
@@ -90,7 +57,6 @@ class BlendshapeItem(baseitem.BaseItem):
     MenuOrder = 11
     MenuIconPath = ICON_PATH
     TypeIconPath = ICON_PATH
-    # PreviewWidgetClass = PoseLoadWidget
 
     def __init__(self, *args, **kwargs):
         """
@@ -102,16 +68,43 @@ class BlendshapeItem(baseitem.BaseItem):
         """
         baseitem.BaseItem.__init__(self, *args, **kwargs)
 
+        self._frameRangeCache = None
+
         self.setTransferClass(mutils.Animation)
         self.setTransferBasename("")
 
+    def _frameRange(self):
+        """
+        Return the start and end frame for the animation.
+
+        The frame range and its display strings are cached for the
+        current transfer object.
+
+        :rtype: (int, int, str, str)
+        """
+        transferObject = self.transferObject()
+
+        if self._frameRangeCache is None or \
+                self._frameRangeCache[0] is not transferObject:
+            startFrame = transferObject.startFrame()
+            endFrame = transferObject.endFrame()
+            self._frameRangeCache = (
+                transferObject,
+                startFrame,
+                endFrame,
+                str(startFrame),
+                str(endFrame),
+            )
+
+        return self._frameRangeCache[1:]
+
     def startFrame(self):
         """Return the start frame for the animation."""
-        return self.transferObject().startFrame()
+        return self._frameRange()[0]
 
     def endFrame(self):
         """Return the end frame for the animation."""
-        return self.transferObject().endFrame()
+        return self._frameRange()[1]
 
     def imageSequencePath(self):
         """
@@ -129,22 +122,24 @@ class BlendshapeItem(baseitem.BaseItem):
         """
         info = baseitem.BaseItem.info(self)
 
-        startFrame = str(self.startFrame())
-        endFrame = str(self.endFrame())
+        startFrame, endFrame = self._frameRange()[2:]
 
-        info.insert(3, {"name": "Start frame", "value": startFrame})
-        info.insert(4, {"name": "End frame", "value": endFrame})
+        info[3:3] = [
+            {"name": "Start frame", "value": startFrame},
+            {"name": "End frame", "value": endFrame},
+        ]
 
         return info
 
     def loadSchema(self):
         """
         Get the options for the item.
-        
+
         :rtype: list[dict]
         """
-        startFrame = self.startFrame() or 0
-        endFrame = self.endFrame() or 0
+        startFrame, endFrame = self._frameRange()[:2]
+        startFrame = startFrame or 0
+        endFrame = endFrame or 0
 
         schema = [
             {
@@ -195,23 +190,19 @@ class BlendshapeItem(baseitem.BaseItem):
         
         :type values: list[dict]
         """
-        super(BlendshapeItem, self).loadValidator(**values)
+        fields = super(BlendshapeItem, self).loadValidator(**values)
 
         option = values.get("option")
         connect = values.get("connect")
 
-        if option == "replace all":
-            basename = "replaceCompletely"
-            connect = False
-        else:
-            basename = option
+        basename = _OPTION_MAP.get(option, option)
 
-        if connect and basename != "replaceCompletely":
-            basename += "Connect"
+        if connect:
+            basename = _CONNECT_SUFFIX.get(basename, basename)
 
         logger.debug(basename)
 
-        return super(BlendshapeItem, self).loadValidator(**values)
+        return fields
 
     @mutils.showWaitCursor
     def load(
@@ -227,7 +218,7 @@ class BlendshapeItem(baseitem.BaseItem):
         :type namespaces: list[str]
         :type options: dict
         """
-        logger.info(u'Loading: {0}'.format(self.path()))
+        logger.info(u'Loading: %s', self.path())
 
         objects = objects or []
 
@@ -236,8 +227,7 @@ class BlendshapeItem(baseitem.BaseItem):
         connect = options.get("connect")
         currentTime = options.get("currentTime")
 
-        if option.lower() == "replace all":
-            option = "replaceCompletely"
+        option = _OPTION_MAP.get(option.lower() if option else "", option)
 
         if source and source != [0, 0]:
             sourceStart, sourceEnd = source
@@ -260,7 +250,7 @@ class BlendshapeItem(baseitem.BaseItem):
             sourceTime=(sourceStart, sourceEnd)
         )
 
-        logger.info(u'Loaded: {0}'.format(self.path()))
+        logger.info(u'Loaded: %s', self.path())
 
     def saveValidator(self, **kwargs):
         """
@@ -272,38 +262,33 @@ class BlendshapeItem(baseitem.BaseItem):
         fields = super(BlendshapeItem, self).saveValidator(**kwargs)
 
         # Validate the by frame field
-        if kwargs.get("byFrame") == '' or kwargs.get("byFrame", 1) < 1:
+        byFrame = kwargs.get("byFrame", 1)
+        if byFrame == '' or byFrame < 1:
             msg = "The by frame value cannot be less than 1!"
-            fields.extend([
-                {
-                    "name": "byFrame",
-                    "error": msg
-                }
-            ])
+            fields.append({
+                "name": "byFrame",
+                "error": msg
+            })
 
         # Validate the frame range field
-        start, end = kwargs.get("frameRange", (0, 1))
+        start, end = kwargs.get("frameRange", _DEFAULT_FRAME_RANGE)
         if start >= end:
             msg = "The start frame cannot be greater " \
                   "than or equal to the end frame!"
-            fields.extend([
-                {
-                    "name": "frameRange",
-                    "error": msg
-                }
-            ])
+            fields.append({
+                "name": "frameRange",
+                "error": msg
+            })
 
         # Validate the current selection field
         selection = maya.cmds.ls(selection=True) or []
         if selection and mutils.getDurationFromNodes(selection) <= 0:
             msg = "No animation was found on the selected object/s! " \
                   "Please create a pose instead!"
-            fields.extend([
-                {
-                    "name": "contains",
-                    "error": msg,
-                }
-            ])
+            fields.append({
+                "name": "contains",
+                "error": msg,
+            })
 
         return fields
 
@@ -399,15 +384,20 @@ class BlendshapeItem(baseitem.BaseItem):
         """
         super(BlendshapeItem, self).write(path, objects, iconPath, **options)
 
+        comment = options.get("comment", "")
+        fileType = options.get("fileType")
+        frameRange = options.get("frameRange")
+        bake = options.get("bake")
+
         # Save the pose to the temp location
         mutils.saveBlendshape(
             objects,
             path,
-            time=options.get("frameRange"),
-            fileType=options.get("fileType"),
+            time=frameRange,
+            fileType=fileType,
             iconPath=iconPath,
-            metadata={"description": options.get("comment", "")},
+            metadata={"description": comment},
             sequencePath=sequencePath,
-            bakeConnected=options.get("bake")
+            bakeConnected=bake
         )
         logger.debug("BlendShape Save!!")
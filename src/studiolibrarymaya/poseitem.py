@@ -112,6 +112,7 @@ class PoseItem(baseitem.BaseItem):
         super(PoseItem, self).__init__(*args, **kwargs)
 
         self._options = None
+        self._lastBlend = None
 
         self.setBlendingEnabled(True)
         self.setTransferClass(mutils.Pose)
@@ -146,6 +147,21 @@ class PoseItem(baseitem.BaseItem):
 
         return fields
 
+    def emitLoadValueChanged(self, field, value):
+        """
+        Overriding this method to update the cached mirror option.
+
+        The mirror option can change during blending, for example when
+        pressing the M key, so the cached value must be kept in sync.
+
+        :type field: str
+        :type value: object
+        """
+        if field == "mirror" and self._options is not None:
+            self._options["mirror"] = value
+
+        super(PoseItem, self).emitLoadValueChanged(field, value)
+
     def mirrorTableSearchAndReplace(self):
         """
         Get the values for search and replace from the mirror table.
@@ -285,6 +301,7 @@ class PoseItem(baseitem.BaseItem):
     def stopBlending(self):
         """This method is called from the base class to stop blending."""
         self._options = None
+        self._lastBlend = None
         baseitem.BaseItem.stopBlending(self)
 
     def setBlendValue(self, value, load=True):
@@ -294,9 +311,14 @@ class PoseItem(baseitem.BaseItem):
         :type value: float
         :type load: bool
         """
+        # Skip loading the pose again if the blend value hasn't changed
+        if load and self._lastBlend == value:
+            return
+
         super(PoseItem, self).setBlendValue(value)
 
         if load:
+            self._lastBlend = value
             self.loadFromCurrentOptions(
                 blend=value,
                 batchMode=True,
@@ -324,12 +346,15 @@ class PoseItem(baseitem.BaseItem):
             self._options = dict()
             self._options["key"] = self.currentLoadValue("key")
             # self._options['namespaces'] = self.currentLoadValue("namespaces")
+            self._options['mirror'] = self.currentLoadValue("mirror")
             self._options['mirrorTable'] = self.mirrorTable()
             self._options['objects'] = maya.cmds.ls(selection=True) or []
 
-        searchAndReplace = None
-        if self.currentLoadValue("searchAndReplaceEnabled"):
-            searchAndReplace = self.currentLoadValue("searchAndReplace")
+            searchAndReplace = None
+            if self.currentLoadValue("searchAndReplaceEnabled"):
+                searchAndReplace = self.currentLoadValue("searchAndReplace")
+
+            self._options['searchAndReplace'] = searchAndReplace
 
         try:
             self.load(
@@ -338,7 +363,6 @@ class PoseItem(baseitem.BaseItem):
                 batchMode=batchMode,
                 clearSelection=clearSelection,
                 showBlendMessage=showBlendMessage,
-                searchAndReplace=searchAndReplace,
                 **self._options
             )
         except Exception as error:
@@ -376,10 +400,12 @@ class PoseItem(baseitem.BaseItem):
         :type mirrorTable: mutils.MirrorTable
         :type searchAndReplace: (str, str) or None
         """
-        logger.debug(u'Loading: {0}'.format(self.path()))
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(u'Loading: %s', self.path())
 
-        # The mirror option can change during blending, so we always get
-        # the value instead of caching it. This might make blending slower.
+        # The mirror option is cached while blending and updated by
+        # emitLoadValueChanged when it is toggled.
         if mirror is None:
             mirror = self.currentLoadValue("mirror")
 
@@ -391,7 +417,7 @@ class PoseItem(baseitem.BaseItem):
         if showBlendMessage:
             self.showToastMessage("Blend: {0}%".format(blend))
 
-        logger.info(u'Options: {0}'.format(namespaces))
+        logger.info(u'Options: %s', namespaces)
 
         try:
             self.transferObject().load(
@@ -416,7 +442,8 @@ class PoseItem(baseitem.BaseItem):
             if not batchMode:
                 self.stopBlending()
 
-        logger.debug(u'Loaded: {0}'.format(self.path()))
+        if debug:
+            logger.debug(u'Loaded: %s', self.path())
 
     def write(self, path, objects, iconPath="", **options):
         """